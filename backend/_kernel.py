@@ -0,0 +1,105 @@
+"""
+Smart Task Analyzer - Compiled Scoring Kernel
+
+Numba-compiled version of the batch scoring arithmetic used by
+TaskScorer. Urgency bands, effort lookup, dependency capping and the
+weighted sum are fused into a single loop with no temporary arrays.
+
+Numba is optional: when it is not installed, score_kernel is None and
+TaskScorer uses its NumPy implementation instead, while urgency_band
+stays a plain Python function.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba not installed - NumPy path is used
+    njit = None
+
+
+def urgency_band(days: int, weekend_boost: float) -> float:
+    """
+    Urgency for one task.
+    Also used directly by TaskScorer's scalar path; scoring._urgency_bands
+    is the vectorized counterpart for the NumPy batch path.
+    """
+    if days < 0:
+        # Past due - exponential penalty
+        return min(100.0 + abs(days) * 10.0, 200.0)
+    elif days == 0:
+        return 95.0 + weekend_boost
+    elif days <= 1:
+        return 90.0 + weekend_boost
+    elif days <= 3:
+        return 80.0 + weekend_boost
+    elif days <= 7:
+        return 70.0 - (days - 3) * 2.5 + weekend_boost
+    elif days <= 14:
+        return 55.0 - (days - 7) * 2.0 + weekend_boost
+    elif days <= 30:
+        return 35.0 - (days - 14) * 1.5 + weekend_boost
+    else:
+        return max(10.0, 35.0 - (days - 30) * 0.5 + weekend_boost)
+
+
+def _score_kernel(
+    days: np.ndarray,
+    weekend_boost: np.ndarray,
+    valid: np.ndarray,
+    hours: np.ndarray,
+    importance: np.ndarray,
+    blocking_counts: np.ndarray,
+    weights: np.ndarray,
+    effort_thresholds: np.ndarray,
+    effort_points: np.ndarray
+):
+    """
+    Score a batch of tasks in one pass.
+    Returns (urgency, effort, dependency, scores) arrays.
+    """
+    n = days.shape[0]
+    urgency = np.empty(n)
+    effort = np.empty(n)
+    dependency = np.empty(n)
+    scores = np.empty(n)
+
+    for i in range(n):
+        urgency[i] = urgency_band(days[i], weekend_boost[i]) if valid[i] else 50.0
+        effort[i] = effort_points[np.searchsorted(effort_thresholds, hours[i])]
+        dependency[i] = min(blocking_counts[i] * 20, 100)
+        scores[i] = (
+            urgency[i] * weights[0] +
+            importance[i] * 10 * weights[1] +
+            effort[i] * weights[2] +
+            dependency[i] * weights[3]
+        )
+
+    return urgency, effort, dependency, scores
+
+
+if njit is not None:
+    # No parallel=True: the API calls the scorer from several worker threads
+    # at once, which Numba's default threading layer does not support.
+    urgency_band = njit(cache=True)(urgency_band)
+    score_kernel = njit(cache=True)(_score_kernel)
+
+    # Compile at import with the dtypes TaskScorer passes (strategy weights
+    # are read-only), so the first request does not pay for JIT compilation
+    _weights = np.zeros(4)
+    _weights.setflags(write=False)
+    score_kernel(
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.float64),
+        np.ones(1, dtype=np.bool_),
+        np.ones(1, dtype=np.float64),
+        np.ones(1, dtype=np.int64),
+        np.zeros(1, dtype=np.int32),
+        _weights,
+        np.zeros(3, dtype=np.float64),
+        np.zeros(4, dtype=np.float64)
+    )
+    urgency_band(0, 0.0)
+    del _weights
+else:
+    score_kernel = None
@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the Smart Task Analyzer backend tests
+"""
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers",
+        "slow: cycles through multiple strategies or walks dependency graphs "
+        "(deselect with -m \"not slow\")"
+    )
@@ -3,46 +3,74 @@ Feedback System for Learning-based Task Prioritization
 Stores user feedback and adjusts strategy weights accordingly
 """
 
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional
 from datetime import datetime
 
+import numpy as np
+
+
+# Fixed orderings used to index the feedback arrays
+_STRATEGIES = ('smart_balance', 'fastest_wins', 'high_impact', 'deadline_driven')
+_FACTORS = ('urgency', 'importance', 'effort', 'dependencies')
+
+
+class FeedbackEntry(NamedTuple):
+    """A single piece of user feedback on a suggested task."""
+    task_title: str
+    was_helpful: bool
+    strategy_used: str
+    timestamp: str
+
 
 class FeedbackStore:
     """
     In-memory storage for user feedback on task suggestions.
     In production, this would be persisted to a database.
+    
+    Strategy preferences and weight adjustments are small NumPy arrays
+    indexed by _STRATEGIES and _FACTORS respectively. Only the most recent
+    MAX_HISTORY entries are kept; the summary covers that window.
     """
     
+    __slots__ = ('feedback_history', 'strategy_preferences', 'weight_adjustments', '_helpful_count')
+    
+    MAX_HISTORY = 10_000
+    
+    # Base weights for each strategy, ordered as _FACTORS
+    _BASE_WEIGHTS = {
+        'smart_balance': np.array([0.35, 0.30, 0.20, 0.15]),
+        'fastest_wins': np.array([0.25, 0.20, 0.40, 0.15]),
+        'high_impact': np.array([0.20, 0.50, 0.15, 0.15]),
+        'deadline_driven': np.array([0.50, 0.25, 0.10, 0.15])
+    }
+    
+    # Factor each specialised strategy's feedback adjusts
+    _STRATEGY_FOCUS = {
+        'deadline_driven': _FACTORS.index('urgency'),
+        'high_impact': _FACTORS.index('importance'),
+        'fastest_wins': _FACTORS.index('effort')
+    }
+    
     def __init__(self):
-        self.feedback_history: List[Dict] = []
-        self.strategy_preferences: Dict[str, int] = {
-            'smart_balance': 0,
-            'fastest_wins': 0,
-            'high_impact': 0,
-            'deadline_driven': 0
-        }
-        self.weight_adjustments: Dict[str, float] = {
-            'urgency': 0.0,
-            'importance': 0.0,
-            'effort': 0.0,
-            'dependencies': 0.0
-        }
+        self.feedback_history: Deque[FeedbackEntry] = deque(maxlen=self.MAX_HISTORY)
+        self._helpful_count = 0  # Helpful entries currently in feedback_history
+        self.strategy_preferences = np.zeros(len(_STRATEGIES), dtype=int)
+        self.weight_adjustments = np.zeros(len(_FACTORS))
     
     def add_feedback(self, task_title: str, was_helpful: bool, strategy_used: str):
         """Record user feedback on a suggested task."""
-        feedback = {
-            'task_title': task_title,
-            'was_helpful': was_helpful,
-            'strategy_used': strategy_used,
-            'timestamp': datetime.now().isoformat()
-        }
+        feedback = FeedbackEntry(task_title, was_helpful, strategy_used, datetime.now().isoformat())
+        # Keep the running count in step with the entry the deque will evict
+        if len(self.feedback_history) == self.feedback_history.maxlen:
+            if self.feedback_history[0].was_helpful:
+                self._helpful_count -= 1
         self.feedback_history.append(feedback)
+        if was_helpful:
+            self._helpful_count += 1
         
         # Update strategy preferences
-        if was_helpful:
-            self.strategy_preferences[strategy_used] += 1
-        else:
-            self.strategy_preferences[strategy_used] -= 1
+        self.strategy_preferences[_STRATEGIES.index(strategy_used)] += 1 if was_helpful else -1
         
         # Adjust weights based on feedback patterns
         self._adjust_weights(strategy_used, was_helpful)
@@ -56,46 +84,32 @@ class FeedbackStore:
         adjustment = 0.02 if was_helpful else -0.02
         
         # Strategy-specific weight adjustments
-        if strategy == 'deadline_driven':
-            self.weight_adjustments['urgency'] += adjustment
-        elif strategy == 'high_impact':
-            self.weight_adjustments['importance'] += adjustment
-        elif strategy == 'fastest_wins':
-            self.weight_adjustments['effort'] += adjustment
+        focus = self._STRATEGY_FOCUS.get(strategy)
+        if focus is not None:
+            self.weight_adjustments[focus] += adjustment
         else:  # smart_balance
             # Distribute adjustment across all factors
-            for factor in self.weight_adjustments:
-                self.weight_adjustments[factor] += adjustment / 4
+            self.weight_adjustments += adjustment / 4
         
         # Clamp adjustments to reasonable range (-0.2 to +0.2)
-        for factor in self.weight_adjustments:
-            self.weight_adjustments[factor] = max(-0.2, min(0.2, self.weight_adjustments[factor]))
+        np.clip(self.weight_adjustments, -0.2, 0.2, out=self.weight_adjustments)
     
     def get_personalized_weights(self, base_strategy: str) -> Dict[str, float]:
         """
         Get personalized weights for a strategy based on user feedback.
         Returns adjusted weights that can be used in the scoring algorithm.
         """
-        # Base weights for each strategy
-        base_weights = {
-            'smart_balance': {'urgency': 0.35, 'importance': 0.30, 'effort': 0.20, 'dependencies': 0.15},
-            'fastest_wins': {'urgency': 0.25, 'importance': 0.20, 'effort': 0.40, 'dependencies': 0.15},
-            'high_impact': {'urgency': 0.20, 'importance': 0.50, 'effort': 0.15, 'dependencies': 0.15},
-            'deadline_driven': {'urgency': 0.50, 'importance': 0.25, 'effort': 0.10, 'dependencies': 0.15}
-        }
-        
-        weights = base_weights.get(base_strategy, base_weights['smart_balance']).copy()
+        base = self._BASE_WEIGHTS.get(base_strategy, self._BASE_WEIGHTS['smart_balance'])
         
         # Apply personalized adjustments
-        for factor, adjustment in self.weight_adjustments.items():
-            weights[factor] += adjustment
+        weights = base + self.weight_adjustments
         
         # Normalize to ensure weights sum to 1.0
-        total = sum(weights.values())
+        total = weights.sum()
         if total > 0:
-            weights = {k: v / total for k, v in weights.items()}
+            weights /= total
         
-        return weights
+        return dict(zip(_FACTORS, weights.tolist()))
     
     def get_recommended_strategy(self) -> str:
         """Get the strategy with the most positive feedback."""
@@ -103,16 +117,18 @@ class FeedbackStore:
             return 'smart_balance'
         
         # Find strategy with highest preference score
-        best_strategy = max(self.strategy_preferences.items(), key=lambda x: x[1])
+        best = int(np.argmax(self.strategy_preferences))
         
         # Only recommend if it has positive feedback
-        if best_strategy[1] > 0:
-            return best_strategy[0]
+        if self.strategy_preferences[best] > 0:
+            return _STRATEGIES[best]
         
         return 'smart_balance'
     
     def get_feedback_summary(self) -> Dict:
         """Get summary of feedback statistics."""
+        weight_adjustments = dict(zip(_FACTORS, self.weight_adjustments.tolist()))
+        
         total_feedback = len(self.feedback_history)
         if total_feedback == 0:
             return {
@@ -120,18 +136,18 @@ class FeedbackStore:
                 'helpful_count': 0,
                 'helpful_percentage': 0,
                 'recommended_strategy': 'smart_balance',
-                'weight_adjustments': self.weight_adjustments
+                'weight_adjustments': weight_adjustments
             }
         
-        helpful_count = sum(1 for f in self.feedback_history if f['was_helpful'])
+        helpful_count = self._helpful_count
         
         return {
             'total_feedback': total_feedback,
             'helpful_count': helpful_count,
             'helpful_percentage': round((helpful_count / total_feedback) * 100, 1),
             'recommended_strategy': self.get_recommended_strategy(),
-            'weight_adjustments': self.weight_adjustments,
-            'strategy_preferences': self.strategy_preferences
+            'weight_adjustments': weight_adjustments,
+            'strategy_preferences': dict(zip(_STRATEGIES, self.strategy_preferences.tolist()))
         }
 
 
@@ -5,7 +5,11 @@ Main application with API endpoints for task analysis and suggestions.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from functools import lru_cache
 from typing import List
+import os
 import uvicorn
 
 from schemas import (
@@ -25,19 +29,43 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="Smart Task Analyzer API",
     description="Intelligent task prioritization and analysis system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # Faster JSON encoding for large task lists
 )
 
+# Note: scoring is CPU-bound. Handlers below are `async def`, so they must
+# offload it with run_in_threadpool instead of calling the scorer directly,
+# otherwise one large request blocks the event loop for every other client.
+
 # Configure CORS
+# Comma-separated list of frontend origins; defaults to the local dev server.
+# An explicit list without credentials lets Starlette check origins with a
+# plain set lookup instead of reflecting each request's origin.
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:8080,http://127.0.0.1:8080").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
 
+@lru_cache(maxsize=8)
+def get_scorer(strategy: str) -> TaskScorer:
+    """
+    Shared scorer per strategy.
+    TaskScorer keeps no per-request state, so one instance (and its
+    business-day calendar) can serve every request.
+    """
+    return TaskScorer(strategy=strategy)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -87,10 +115,10 @@ async def analyze_tasks(request: TaskAnalyzeRequest):
             )
         
         # Create scorer with specified strategy
-        scorer = TaskScorer(strategy=strategy)
+        scorer = get_scorer(strategy)
         
         # Score and sort tasks
-        scored_tasks = scorer.score_tasks(request.tasks)
+        scored_tasks = await run_in_threadpool(scorer.score_tasks, request.tasks)
         
         return TaskAnalyzeResponse(
             tasks=scored_tasks,
@@ -122,10 +150,10 @@ async def suggest_tasks(tasks: List[TaskBase]):
             raise HTTPException(status_code=400, detail="No tasks provided")
         
         # Use smart_balance strategy for suggestions
-        scorer = TaskScorer(strategy="smart_balance")
+        scorer = get_scorer("smart_balance")
         
         # Get top 3 suggestions
-        suggested = scorer.suggest_top_tasks(tasks, count=3)
+        suggested = await run_in_threadpool(scorer.suggest_top_tasks, tasks, count=3)
         
         return SuggestResponse(
             suggested_tasks=suggested,
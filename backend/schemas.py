@@ -1,21 +1,23 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional, Union
+from datetime import date, datetime
 
 class TaskBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
-    due_date: str
+    # ISO format (YYYY-MM-DD); full ISO datetimes are also accepted.
+    # Datetimes at exactly midnight are normalized to a plain date.
+    due_date: Union[date, datetime]
     estimated_hours: float = Field(..., gt=0)
     importance: int = Field(..., ge=1, le=10)
     dependencies: List[int] = Field(default_factory=list)
 
-    @validator('due_date')
-    def validate_due_date(cls, v):
-        try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
-            return v
-        except ValueError:
+    @field_validator('due_date', mode='before')
+    @classmethod
+    def reject_non_iso_due_date(cls, v):
+        # Pydantic would otherwise accept Unix timestamps for date fields
+        if not isinstance(v, (str, date)):
             raise ValueError('Invalid date format. Use ISO format (YYYY-MM-DD)')
+        return v
 
 class TaskCreate(TaskBase):
     pass
@@ -8,9 +8,149 @@ This module implements intelligent task prioritization based on multiple factors
 - Dependencies (blocking other tasks)
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+import heapq
+from bisect import bisect_left
+from datetime import date, datetime
+from functools import lru_cache
+from typing import AbstractSet, Callable, FrozenSet, List, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
 from schemas import TaskBase, TaskResponse
+from _kernel import score_kernel, urgency_band
+
+
+# Shared result for task lists without any circular dependencies
+_NO_CYCLES: FrozenSet[int] = frozenset()
+
+# Effort bands: hours <= thresholds[i] scores scores[i], anything larger gets scores[-1]
+# Fastest wins prefers quick tasks
+_FASTEST_THRESHOLDS = (1, 3, 8)
+_FASTEST_SCORES = (90, 70, 50, 30)
+# Balanced approach - moderate effort is the sweet spot
+_BALANCED_THRESHOLDS = (2, 5, 10)
+_BALANCED_SCORES = (70, 80, 60, 40)
+
+
+def _effort_table(strategy: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Effort (thresholds, scores) table for a strategy."""
+    if strategy == "fastest_wins":
+        return _FASTEST_THRESHOLDS, _FASTEST_SCORES
+    return _BALANCED_THRESHOLDS, _BALANCED_SCORES
+
+
+def _readonly(values) -> np.ndarray:
+    """Build a float array that cannot be modified in place."""
+    arr = np.array(values, dtype=float)
+    arr.setflags(write=False)
+    return arr
+
+
+class _BatchFactors(NamedTuple):
+    """Per-task scoring factors for one batch, indexed by task position."""
+    due_dates: List[Optional[date]]
+    days_until: np.ndarray
+    urgency: np.ndarray
+    importance: np.ndarray
+    effort: np.ndarray
+    dependency: np.ndarray
+    scores: np.ndarray
+
+
+def _priority_key(task: TaskResponse) -> float:
+    """Sort key for scored tasks (unscored tasks rank last)."""
+    return task.priority_score or 0
+
+
+def _adjacency(tasks: Sequence[TaskBase]) -> Tuple[FrozenSet[int], ...]:
+    """Dependency graph as one frozenset of dependency indices per task."""
+    return tuple(frozenset(task.dependencies) for task in tasks)
+
+
+@lru_cache(maxsize=1024)
+def _parse_due_date(due_date: Union[date, str]) -> Optional[date]:
+    """
+    Normalize a due date to a date, returning None when it is malformed.
+    Validated tasks already carry a date; ISO strings are still accepted.
+    """
+    if isinstance(due_date, datetime):
+        return due_date.date()
+    if isinstance(due_date, date):
+        return due_date
+    try:
+        return datetime.fromisoformat(due_date.replace('Z', '+00:00')).date()
+    except (ValueError, AttributeError):
+        return None
+
+
+def _urgency_bands(days: np.ndarray, weekend_boost: np.ndarray) -> np.ndarray:
+    """
+    Map an array of days-until-due onto the urgency scale.
+    See TaskScorer.calculate_urgency_score for the band definitions.
+    """
+    days = days.astype(float)
+    conditions = [
+        days < 0,
+        days == 0,
+        days <= 1,
+        days <= 3,
+        days <= 7,
+        days <= 14,
+        days <= 30,
+    ]
+    choices = [
+        np.minimum(100 + np.abs(days) * 10, 200),  # Past due - exponential penalty
+        95 + weekend_boost,
+        90 + weekend_boost,
+        80 + weekend_boost,
+        70 - (days - 3) * 2.5 + weekend_boost,
+        55 - (days - 7) * 2 + weekend_boost,
+        35 - (days - 14) * 1.5 + weekend_boost,
+    ]
+    default = np.maximum(10, 35 - (days - 30) * 0.5 + weekend_boost)
+    return np.select(conditions, choices, default=default)
+
+
+def _days_and_weekend_boost(
+    due: np.ndarray,
+    today: np.datetime64,
+    busday: Optional[np.busdaycalendar]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Days until each due date and its weekend boost; works on arrays and scalars.
+    Counts business days with the given calendar, or calendar days when it is None.
+    """
+    if busday is None:
+        return (due - today).astype(np.int64), np.zeros(np.shape(due))
+    
+    days_until_due = np.busday_count(today, due, busdaycal=busday).astype(np.int64)
+    
+    # Weekend boost: if due on weekend, increase urgency
+    weekend_boost = np.where(np.is_busday(due), 0.0, 10.0)
+    return days_until_due, weekend_boost
+
+
+@lru_cache(maxsize=1024)
+def _urgency_core(
+    due_date: Union[date, str],
+    today: date,
+    busday: Optional[np.busdaycalendar]
+) -> Tuple[float, Optional[int]]:
+    """
+    Urgency score and days until due for a single date.
+    Memoized because task lists often share due dates (e.g. end of sprint).
+    Days is None when the date cannot be parsed.
+    """
+    due_date = _parse_due_date(due_date)
+    if due_date is None:
+        # Invalid date format - return neutral score
+        return 50, None
+    
+    days_until_due, weekend_boost = _days_and_weekend_boost(
+        np.datetime64(due_date, 'D'), np.datetime64(today, 'D'), busday
+    )
+    days_until_due = int(days_until_due)
+    return float(urgency_band(days_until_due, float(weekend_boost))), days_until_due
 
 
 class TaskScorer:
@@ -19,7 +159,7 @@ class TaskScorer:
     """
     
     # US Federal Holidays for 2025 (can be extended)
-    HOLIDAYS_2025 = [
+    HOLIDAYS_2025 = (
         "2025-01-01",  # New Year's Day
         "2025-01-20",  # Martin Luther King Jr. Day
         "2025-02-17",  # Presidents' Day
@@ -30,11 +170,47 @@ class TaskScorer:
         "2025-11-11",  # Veterans Day
         "2025-11-27",  # Thanksgiving
         "2025-12-25",  # Christmas
-    ]
+    )
+    
+    # Precomputed lookups so holiday checks avoid per-call string formatting
+    _HOLIDAY_SET = frozenset(date.fromisoformat(d) for d in HOLIDAYS_2025)
+    _HOLIDAY_ARR = np.array(HOLIDAYS_2025, dtype='datetime64[D]')
+    # Mon-Fri business-day calendar, shared by every scorer (and the urgency cache)
+    _BUSDAY = np.busdaycalendar(weekmask='1111100', holidays=_HOLIDAY_ARR)
+    
+    # Strategy weights ordered as (urgency, importance, effort, dependency)
+    _STRATEGY_WEIGHTS = {
+        "smart_balance": _readonly([0.35, 0.30, 0.20, 0.15]),
+        "fastest_wins": _readonly([0.2, 0.2, 0.5, 0.1]),
+        "high_impact": _readonly([0.15, 0.6, 0.1, 0.15]),
+        "deadline_driven": _readonly([0.7, 0.15, 0.05, 0.1]),
+    }
     
     def __init__(self, strategy: str = "smart_balance", use_business_days: bool = True):
         self.strategy = strategy
         self.use_business_days = use_business_days
+        self._w = self._STRATEGY_WEIGHTS.get(strategy, self._STRATEGY_WEIGHTS["smart_balance"])
+        self._effort_thresholds, self._effort_points = _effort_table(strategy)
+        self._effort_arrays = (
+            np.array(self._effort_thresholds, dtype=float),
+            np.array(self._effort_points, dtype=float)
+        )
+        self._score_one = self._build_specialized()
+        self._busday = self._BUSDAY if use_business_days else None
+    
+    def _build_specialized(self) -> Callable[[float, float, float, float], float]:
+        """
+        Build the weighted-sum function for this scorer's strategy.
+        The weights are bound as closure locals, so scoring a single task
+        does no strategy lookup and allocates no arrays. It works unchanged
+        on NumPy factor arrays for the batch path.
+        """
+        w_urg, w_imp, w_eff, w_dep = (float(w) for w in self._w)
+        
+        def score_one(urgency: float, importance: float, effort: float, dependency: float) -> float:
+            return urgency * w_urg + importance * w_imp + effort * w_eff + dependency * w_dep
+        
+        return score_one
     
     def is_weekend(self, date: datetime) -> bool:
         """Check if a date falls on a weekend (Saturday=5, Sunday=6)."""
@@ -42,65 +218,103 @@ class TaskScorer:
     
     def is_holiday(self, date: datetime) -> bool:
         """Check if a date is a US federal holiday."""
-        date_str = date.date().isoformat()
-        return date_str in self.HOLIDAYS_2025
+        return date.date() in self._HOLIDAY_SET
     
     def calculate_business_days(self, start_date: datetime, end_date: datetime) -> int:
         """
         Calculate number of business days between two dates.
-        Excludes weekends and optionally holidays.
+        Excludes weekends and holidays. Counts whole days in
+        [start_date, end_date); negative when end_date is earlier.
         """
-        if start_date > end_date:
-            return -self.calculate_business_days(end_date, start_date)
-        
-        business_days = 0
-        current_date = start_date
+        return int(np.busday_count(
+            np.datetime64(start_date.date()),
+            np.datetime64(end_date.date()),
+            busdaycal=self._BUSDAY
+        ))
         
-        while current_date < end_date:
-            if not self.is_weekend(current_date) and not self.is_holiday(current_date):
-                business_days += 1
-            current_date += timedelta(days=1)
+    def detect_circular_dependencies(
+        self,
+        tasks: Union[Sequence[TaskBase], Sequence[AbstractSet[int]]]
+    ) -> FrozenSet[int]:
+        """
+        Detect circular dependencies using an iterative Tarjan SCC pass.
+        Returns set of task indices involved in circular dependencies.
         
-        return business_days
+        Accepts either the tasks themselves or a prebuilt adjacency (one set
+        of dependency indices per task, as built by _adjacency) so callers
+        that check the same graph repeatedly can build it once.
         
-    def detect_circular_dependencies(self, tasks: List[TaskBase]) -> List[int]:
-        """
-        Detect circular dependencies using DFS.
-        Returns list of task indices involved in circular dependencies.
+        Every task is visited once and every dependency edge followed once,
+        with no recursion, so long dependency chains cannot hit the
+        recursion limit.
         """
-        task_map = {i: task for i, task in enumerate(tasks)}
-        visited = set()
-        rec_stack = set()
+        if tasks and isinstance(tasks[0], TaskBase):
+            # Common case: no task has dependencies, so there is nothing to walk
+            if not any(task.dependencies for task in tasks):
+                return _NO_CYCLES
+            graph = _adjacency(tasks)
+        elif not any(tasks):
+            return _NO_CYCLES
+        else:
+            graph = tasks
+        
+        n = len(graph)
+        adjacency = [[dep for dep in deps if 0 <= dep < n] for deps in graph]
+        
+        index = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
         circular_tasks = set()
+        counter = 0
         
-        def dfs(task_idx: int, path: set) -> bool:
-            if task_idx in rec_stack:
-                circular_tasks.update(path)
-                return True
-            if task_idx in visited:
-                return False
-                
-            visited.add(task_idx)
-            rec_stack.add(task_idx)
-            path.add(task_idx)
-            
-            task = task_map.get(task_idx)
-            if task and task.dependencies:
-                for dep_id in task.dependencies:
-                    if dep_id < len(tasks):
-                        if dfs(dep_id, path.copy()):
-                            circular_tasks.add(task_idx)
+        for root in range(n):
+            if index[root] != -1:
+                continue
             
-            rec_stack.remove(task_idx)
-            return False
-        
-        for i in range(len(tasks)):
-            if i not in visited:
-                dfs(i, set())
+            # Each work item is (task index, next dependency position to explore)
+            work = [(root, 0)]
+            while work:
+                task_idx, edge = work.pop()
+                if edge == 0:
+                    index[task_idx] = lowlink[task_idx] = counter
+                    counter += 1
+                    stack.append(task_idx)
+                    on_stack[task_idx] = True
+                
+                deps = adjacency[task_idx]
+                descended = False
+                for pos in range(edge, len(deps)):
+                    dep_id = deps[pos]
+                    if index[dep_id] == -1:
+                        work.append((task_idx, pos + 1))
+                        work.append((dep_id, 0))
+                        descended = True
+                        break
+                    if on_stack[dep_id]:
+                        lowlink[task_idx] = min(lowlink[task_idx], index[dep_id])
+                if descended:
+                    continue
+                
+                # Root of a strongly connected component - pop its members
+                if lowlink[task_idx] == index[task_idx]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == task_idx:
+                            break
+                    if len(component) > 1 or task_idx in deps:
+                        circular_tasks.update(component)
+                
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[task_idx])
         
-        return list(circular_tasks)
+        return frozenset(circular_tasks)
     
-    def calculate_urgency_score(self, due_date_str: str) -> float:
+    def calculate_urgency_score(self, due_date: Union[date, str]) -> float:
         """
         Calculate urgency score based on due date.
         Returns score between 0-200.
@@ -118,90 +332,89 @@ class TaskScorer:
         - Due in 1-2 weeks: 40-55
         - Due in 2+ weeks: 10-35
         """
-        try:
-            due_date = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-            now = datetime.now()
-            
-            # Calculate days until due
-            if self.use_business_days:
-                days_until_due = self.calculate_business_days(now, due_date)
-                
-                # Weekend boost: if due on weekend, increase urgency
-                weekend_boost = 0
-                if self.is_weekend(due_date):
-                    weekend_boost = 10  # Extra urgency for weekend deadlines
-            else:
-                days_until_due = (due_date - now).days
-                weekend_boost = 0
-            
-            # Base urgency calculation
-            if days_until_due < 0:
-                # Past due - exponential penalty
-                overdue_days = abs(days_until_due)
-                return min(100 + (overdue_days * 10), 200)
-            elif days_until_due == 0:
-                return 95 + weekend_boost
-            elif days_until_due <= 1:
-                return 90 + weekend_boost
-            elif days_until_due <= 3:
-                return 80 + weekend_boost
-            elif days_until_due <= 7:
-                return (70 - (days_until_due - 3) * 2.5) + weekend_boost
-            elif days_until_due <= 14:
-                return (55 - (days_until_due - 7) * 2) + weekend_boost
-            elif days_until_due <= 30:
-                return (35 - (days_until_due - 14) * 1.5) + weekend_boost
-            else:
-                return max(10, (35 - (days_until_due - 30) * 0.5) + weekend_boost)
-        except (ValueError, AttributeError):
-            # Invalid date format - return neutral score
-            return 50
+        urgency, _ = self._urgency_and_days(due_date)
+        return urgency
+    
+    def _urgency_and_days(self, due_date: Union[date, str]) -> Tuple[float, Optional[int]]:
+        """
+        Urgency score together with the days until due for one date.
+        Days is None when the date cannot be parsed.
+        """
+        return _urgency_core(due_date, date.today(), self._busday)
+    
+    def _urgency_scores(self, due: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized urgency scoring over an array of due dates.
+        Returns (urgency scores, days until due). Missing dates (NaT)
+        get the neutral score of 50.
+        """
+        days_until_due, weekend_boost, valid = self._days_until_due(due)
+        urgency = np.where(valid, _urgency_bands(days_until_due, weekend_boost), 50)
+        return urgency, days_until_due
+    
+    def _days_until_due(self, due: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Days until each due date, the weekend boost for each, and a mask
+        of which dates are present. Missing dates count as due today.
+        """
+        today = np.datetime64(date.today(), 'D')
+        valid = ~np.isnat(due)
+        due = np.where(valid, due, today)
+        
+        days_until_due, weekend_boost = _days_and_weekend_boost(due, today, self._busday)
+        return days_until_due, weekend_boost, valid
     
     def calculate_effort_score(self, estimated_hours: float, strategy: str) -> float:
         """
         Calculate effort score based on estimated hours.
         Strategy affects whether low or high effort is preferred.
         """
-        if strategy == "fastest_wins":
-            # Prefer quick tasks
-            if estimated_hours <= 1:
-                return 90
-            elif estimated_hours <= 3:
-                return 70
-            elif estimated_hours <= 8:
-                return 50
-            else:
-                return 30
-        else:
-            # Balanced approach - moderate effort is good
-            if estimated_hours <= 2:
-                return 70  # Quick wins
-            elif estimated_hours <= 5:
-                return 80  # Sweet spot
-            elif estimated_hours <= 10:
-                return 60
-            else:
-                return 40  # Large tasks
+        thresholds, scores = _effort_table(strategy)
+        return scores[bisect_left(thresholds, estimated_hours)]
     
-    def calculate_dependency_score(self, task_idx: int, tasks: List[TaskBase]) -> float:
+    def _effort_scores(self, hours: np.ndarray) -> np.ndarray:
+        """Vectorized counterpart of calculate_effort_score for the active strategy."""
+        thresholds, points = self._effort_arrays
+        return points[np.searchsorted(thresholds, hours, side='left')]
+    
+    def calculate_dependency_score(
+        self,
+        task_idx: int,
+        tasks: List[TaskBase],
+        blocking_counts: Optional[np.ndarray] = None
+    ) -> float:
         """
         Calculate how many tasks depend on this task.
         Tasks that block others get higher scores.
+        
+        Pass blocking_counts from _blocking_counts when scoring several
+        tasks of the same list to avoid rescanning it for each one.
         """
-        blocking_count = 0
-        for i, task in enumerate(tasks):
-            if task_idx in task.dependencies:
-                blocking_count += 1
+        if blocking_counts is None:
+            blocking_counts = self._blocking_counts(tasks)
+        
+        blocking_count = int(blocking_counts[task_idx]) if 0 <= task_idx < len(blocking_counts) else 0
         
         # Each blocked task adds to the score
         return min(blocking_count * 20, 100)
     
+    def _blocking_counts(self, tasks: List[TaskBase]) -> np.ndarray:
+        """
+        Reverse dependency index: how many tasks depend on each task.
+        Built in a single pass over every task's dependency list.
+        """
+        n = len(tasks)
+        blocking_counts = np.zeros(n, dtype=np.int32)
+        targets = [dep for task in tasks for dep in set(task.dependencies) if 0 <= dep < n]
+        np.add.at(blocking_counts, np.array(targets, dtype=np.intp), 1)
+        return blocking_counts
+    
     def calculate_priority_score(
         self, 
         task: TaskBase, 
         task_idx: int,
         all_tasks: List[TaskBase],
-        circular_deps: List[int]
+        circular_deps: AbstractSet[int]
     ) -> Tuple[float, str]:
         """
         Calculate overall priority score and explanation.
@@ -216,32 +429,18 @@ class TaskScorer:
             return (0, "❌ Invalid task data")
         
         # Calculate component scores
-        urgency = self.calculate_urgency_score(task.due_date)
+        urgency, days_until = self._urgency_and_days(task.due_date)
         importance = task.importance * 10  # Scale 1-10 to 10-100
-        effort = self.calculate_effort_score(task.estimated_hours, self.strategy)
+        effort = self._effort_points[bisect_left(self._effort_thresholds, task.estimated_hours)]
         dependency = self.calculate_dependency_score(task_idx, all_tasks)
         
         # Apply strategy-specific weights
-        if self.strategy == "fastest_wins":
-            weights = {"urgency": 0.2, "importance": 0.2, "effort": 0.5, "dependency": 0.1}
-        elif self.strategy == "high_impact":
-            weights = {"urgency": 0.15, "importance": 0.6, "effort": 0.1, "dependency": 0.15}
-        elif self.strategy == "deadline_driven":
-            weights = {"urgency": 0.7, "importance": 0.15, "effort": 0.05, "dependency": 0.1}
-        else:  # smart_balance
-            weights = {"urgency": 0.35, "importance": 0.30, "effort": 0.20, "dependency": 0.15}
-        
-        # Calculate weighted score
-        score = (
-            urgency * weights["urgency"] +
-            importance * weights["importance"] +
-            effort * weights["effort"] +
-            dependency * weights["dependency"]
-        )
+        score = self._score_one(urgency, importance, effort, dependency)
         
         # Generate explanation
         explanation = self._generate_explanation(
-            urgency, importance, effort, dependency, task
+            urgency, importance, effort, dependency, task,
+            _parse_due_date(task.due_date), days_until
         )
         
         return (round(score, 2), explanation)
@@ -252,22 +451,22 @@ class TaskScorer:
         importance: float, 
         effort: float, 
         dependency: float,
-        task: TaskBase
+        task: TaskBase,
+        due_date: Optional[date],
+        days_until: Optional[int]
     ) -> str:
-        """Generate human-readable explanation for the score."""
+        """
+        Generate human-readable explanation for the score.
+        due_date and days_until come from the urgency calculation, so the
+        date is not parsed or counted a second time here.
+        """
         reasons = []
         
         # Urgency reasoning
-        try:
-            due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-            now = datetime.now()
-            
-            if self.use_business_days:
-                days_until = self.calculate_business_days(now, due_date)
-                day_type = "business days"
-            else:
-                days_until = (due_date - now).days
-                day_type = "days"
+        if due_date is None:
+            reasons.append("⚠️ Invalid due date")
+        else:
+            day_type = "business days" if self.use_business_days else "days"
             
             # Weekend indicator
             weekend_indicator = " 📅" if self.is_weekend(due_date) else ""
@@ -280,8 +479,6 @@ class TaskScorer:
                 reasons.append(f"🟡 Due in {days_until} {day_type}{weekend_indicator}")
             elif days_until <= 7:
                 reasons.append(f"🟢 Due this week{weekend_indicator}")
-        except:
-            reasons.append("⚠️ Invalid due date")
         
         # Importance reasoning
         if task.importance >= 8:
@@ -301,19 +498,81 @@ class TaskScorer:
         
         return " | ".join(reasons) if reasons else "Standard priority"
     
-    def score_tasks(self, tasks: List[TaskBase]) -> List[TaskResponse]:
+    def score_tasks(
+        self,
+        tasks: List[TaskBase],
+        include_explanations: bool = True
+    ) -> List[TaskResponse]:
         """
         Score all tasks and return sorted list with scores and explanations.
+        With include_explanations=False, valid tasks get explanation=None.
+        """
+        scored_tasks = self._compute_scored(tasks, self._compute_factors(tasks), include_explanations)
+        
+        # Sort by priority score (descending)
+        scored_tasks.sort(key=_priority_key, reverse=True)
+        
+        return scored_tasks
+    
+    def _compute_factors(self, tasks: List[TaskBase]) -> _BatchFactors:
+        """
+        Compute every scoring factor for the whole batch.
+        
+        Task fields are gathered into parallel NumPy arrays so each factor
+        is computed for all tasks at once. When Numba is installed the
+        arithmetic runs in the compiled _kernel.score_kernel instead.
+        """
+        n = len(tasks)
+        due_dates = [_parse_due_date(task.due_date) for task in tasks]
+        due = np.array(due_dates, dtype='datetime64[D]')
+        hours = np.fromiter((task.estimated_hours for task in tasks), dtype=float, count=n)
+        importance_raw = np.fromiter((task.importance for task in tasks), dtype=np.int64, count=n)
+        
+        blocking_counts = self._blocking_counts(tasks)
+        importance = importance_raw * 10  # Scale 1-10 to 10-100
+        
+        if score_kernel is not None:
+            days_until, weekend_boost, valid = self._days_until_due(due)
+            urgency, effort, dependency, scores = score_kernel(
+                days_until, weekend_boost, valid, hours, importance_raw,
+                blocking_counts, self._w, *self._effort_arrays
+            )
+            return _BatchFactors(due_dates, days_until, urgency, importance, effort, dependency, scores)
+        
+        # Calculate component scores
+        urgency, days_until = self._urgency_scores(due)
+        effort = self._effort_scores(hours)
+        dependency = np.minimum(blocking_counts * 20, 100)
+        
+        # Same specialized weighted sum as the scalar path, applied element-wise,
+        # so rounding to 2 decimals matches calculate_priority_score
+        scores = self._score_one(urgency, importance, effort, dependency)
+        
+        return _BatchFactors(due_dates, days_until, urgency, importance, effort, dependency, scores)
+    
+    def _compute_scored(
+        self,
+        tasks: List[TaskBase],
+        factors: _BatchFactors,
+        include_explanations: bool = True
+    ) -> List[TaskResponse]:
+        """
+        Build scored responses in input order.
+        Explanations are the only per-task work, so they can be skipped
+        and filled in later with _explain.
         """
         # Detect circular dependencies
         circular_deps = self.detect_circular_dependencies(tasks)
         
-        # Score each task
         scored_tasks = []
         for idx, task in enumerate(tasks):
-            score, explanation = self.calculate_priority_score(
-                task, idx, tasks, circular_deps
-            )
+            if idx in circular_deps:
+                score, explanation = 0.0, "⚠️ Circular dependency detected - needs resolution"
+            elif not task.title or task.estimated_hours <= 0:
+                score, explanation = 0.0, "❌ Invalid task data"
+            else:
+                score = round(float(factors.scores[idx]), 2)
+                explanation = self._explain(task, idx, factors) if include_explanations else None
             
             task_response = TaskResponse(
                 id=idx,
@@ -327,18 +586,29 @@ class TaskScorer:
             )
             scored_tasks.append(task_response)
         
-        # Sort by priority score (descending)
-        scored_tasks.sort(key=lambda x: x.priority_score or 0, reverse=True)
-        
         return scored_tasks
     
+    def _explain(self, task: TaskBase, idx: int, factors: _BatchFactors) -> str:
+        """Explanation for one task of a batch scored by _compute_factors."""
+        return self._generate_explanation(
+            factors.urgency[idx], factors.importance[idx], factors.effort[idx],
+            factors.dependency[idx], task, factors.due_dates[idx], int(factors.days_until[idx])
+        )
+    
     def suggest_top_tasks(self, tasks: List[TaskBase], count: int = 3) -> List[TaskResponse]:
         """
         Suggest top N tasks to work on today.
+        Uses a partial sort, and only builds explanations for the tasks
+        that are actually returned.
         """
-        scored_tasks = self.score_tasks(tasks)
+        factors = self._compute_factors(tasks)
+        scored_tasks = self._compute_scored(tasks, factors, include_explanations=False)
         
         # Filter out invalid tasks and circular dependencies
-        valid_tasks = [t for t in scored_tasks if t.priority_score and t.priority_score > 0]
+        valid_tasks = (t for t in scored_tasks if t.priority_score and t.priority_score > 0)
+        
+        suggested = heapq.nlargest(count, valid_tasks, key=_priority_key)
+        for task_response in suggested:
+            task_response.explanation = self._explain(tasks[task_response.id], task_response.id, factors)
         
-        return valid_tasks[:count]
+        return suggested
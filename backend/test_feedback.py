@@ -0,0 +1,79 @@
+"""
+Unit Tests for the Feedback Store
+"""
+
+import pytest
+from feedback import FeedbackStore
+
+
+class _SmallFeedbackStore(FeedbackStore):
+    """Feedback store with a tiny history window so eviction is easy to hit."""
+    MAX_HISTORY = 3
+
+
+@pytest.fixture
+def store():
+    """Fresh store with a three-entry history window."""
+    return _SmallFeedbackStore()
+
+
+def test_empty_summary(store):
+    """Test the summary before any feedback is recorded."""
+    summary = store.get_feedback_summary()
+    assert summary['total_feedback'] == 0
+    assert summary['helpful_count'] == 0
+    assert summary['recommended_strategy'] == 'smart_balance'
+
+
+def test_helpful_count_tracks_eviction(store):
+    """Test that evicting old entries keeps the helpful count in step with the window."""
+    for helpful in (True, True, False):
+        store.add_feedback("Task", helpful, 'smart_balance')
+    assert store._helpful_count == 2
+    
+    # Evicts the first helpful entry
+    store.add_feedback("Task", False, 'smart_balance')
+    assert store._helpful_count == 1
+    
+    # Evicts the second helpful entry, adds a helpful one
+    store.add_feedback("Task", True, 'smart_balance')
+    assert store._helpful_count == 1
+    
+    summary = store.get_feedback_summary()
+    assert len(store.feedback_history) == 3
+    assert summary['total_feedback'] == 3
+    assert summary['helpful_count'] == sum(entry.was_helpful for entry in store.feedback_history)
+    assert summary['helpful_percentage'] == 33.3
+
+
+def test_strategy_preferences_and_recommendation(store):
+    """Test the per-strategy preference counters behind the recommendation."""
+    store.add_feedback("Task", True, 'high_impact')
+    store.add_feedback("Task", True, 'high_impact')
+    store.add_feedback("Task", False, 'fastest_wins')
+    
+    summary = store.get_feedback_summary()
+    assert summary['strategy_preferences'] == {
+        'smart_balance': 0,
+        'fastest_wins': -1,
+        'high_impact': 2,
+        'deadline_driven': 0
+    }
+    assert summary['recommended_strategy'] == 'high_impact'
+
+
+def test_weight_adjustments(store):
+    """Test that feedback moves the focused factor and clamps the adjustment."""
+    store.add_feedback("Task", True, 'deadline_driven')
+    store.add_feedback("Task", False, 'smart_balance')
+    
+    adjustments = store.get_feedback_summary()['weight_adjustments']
+    assert adjustments['urgency'] == pytest.approx(0.02 - 0.005)
+    assert adjustments['importance'] == pytest.approx(-0.005)
+    
+    for _ in range(20):
+        store.add_feedback("Task", True, 'fastest_wins')
+    assert store.get_feedback_summary()['weight_adjustments']['effort'] == pytest.approx(0.2)
+    
+    weights = store.get_personalized_weights('fastest_wins')
+    assert sum(weights.values()) == pytest.approx(1.0)
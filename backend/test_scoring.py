@@ -2,227 +2,404 @@
 Unit Tests for Smart Task Analyzer Scoring Algorithm
 """
 
+import operator
+import numpy as np
 import pytest
-from datetime import datetime, timedelta
+import scoring
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import combinations
+from pydantic import ValidationError
 from schemas import TaskBase
-from scoring import TaskScorer
-
-
-class TestTaskScorer:
-    """Test suite for TaskScorer class."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.scorer = TaskScorer(strategy="smart_balance")
-        
-        # Sample tasks for testing
-        today = datetime.now().date().isoformat()
-        tomorrow = (datetime.now() + timedelta(days=1)).date().isoformat()
-        next_week = (datetime.now() + timedelta(days=7)).date().isoformat()
-        overdue = (datetime.now() - timedelta(days=2)).date().isoformat()
-        
-        self.sample_tasks = [
-            TaskBase(
-                title="Fix critical bug",
-                due_date=today,
-                estimated_hours=2.0,
-                importance=9,
-                dependencies=[]
-            ),
-            TaskBase(
-                title="Write documentation",
-                due_date=next_week,
-                estimated_hours=5.0,
-                importance=5,
-                dependencies=[]
-            ),
-            TaskBase(
-                title="Overdue task",
-                due_date=overdue,
-                estimated_hours=3.0,
-                importance=7,
-                dependencies=[]
-            ),
-        ]
-    
-    def test_urgency_score_overdue(self):
-        """Test urgency score for overdue tasks."""
-        overdue_date = (datetime.now() - timedelta(days=2)).date().isoformat()
-        score = self.scorer.calculate_urgency_score(overdue_date)
-        assert score > 100, "Overdue tasks should have score > 100"
-    
-    def test_urgency_score_today(self):
-        """Test urgency score for tasks due today."""
-        today = datetime.now().date().isoformat()
-        score = self.scorer.calculate_urgency_score(today)
-        assert score >= 90, "Tasks due today should have high urgency"
-    
-    def test_urgency_score_future(self):
-        """Test urgency score for future tasks."""
-        future = (datetime.now() + timedelta(days=30)).date().isoformat()
-        score = self.scorer.calculate_urgency_score(future)
-        assert score < 50, "Far future tasks should have lower urgency"
-    
-    def test_effort_score_fastest_wins(self):
-        """Test effort scoring with fastest_wins strategy."""
-        scorer = TaskScorer(strategy="fastest_wins")
-        quick_task_score = scorer.calculate_effort_score(1.0, "fastest_wins")
-        long_task_score = scorer.calculate_effort_score(10.0, "fastest_wins")
-        assert quick_task_score > long_task_score, "Quick tasks should score higher in fastest_wins"
-    
-    def test_circular_dependency_detection(self):
-        """Test detection of circular dependencies."""
-        # Create tasks with circular dependency: 0 -> 1 -> 2 -> 0
-        circular_tasks = [
-            TaskBase(
-                title="Task A",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[2]  # Depends on task 2
-            ),
-            TaskBase(
-                title="Task B",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[0]  # Depends on task 0
-            ),
-            TaskBase(
-                title="Task C",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[1]  # Depends on task 1
-            ),
-        ]
-        
-        circular_deps = self.scorer.detect_circular_dependencies(circular_tasks)
-        assert len(circular_deps) > 0, "Should detect circular dependencies"
-    
-    def test_dependency_score(self):
-        """Test dependency scoring - tasks that block others score higher."""
-        tasks = [
-            TaskBase(
-                title="Blocking task",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[]
-            ),
-            TaskBase(
-                title="Dependent task 1",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[0]
-            ),
-            TaskBase(
-                title="Dependent task 2",
-                due_date=datetime.now().date().isoformat(),
-                estimated_hours=2.0,
-                importance=5,
-                dependencies=[0]
-            ),
-        ]
-        
-        score = self.scorer.calculate_dependency_score(0, tasks)
-        assert score > 0, "Task blocking others should have positive dependency score"
-    
-    def test_score_tasks_sorting(self):
-        """Test that tasks are properly sorted by priority."""
-        scored = self.scorer.score_tasks(self.sample_tasks)
-        
-        # Check that we got all tasks back
-        assert len(scored) == len(self.sample_tasks)
-        
-        # Check that scores are in descending order
-        scores = [task.priority_score for task in scored if task.priority_score]
-        assert scores == sorted(scores, reverse=True), "Tasks should be sorted by score descending"
-    
-    def test_invalid_date_handling(self):
-        """Test handling of invalid date formats."""
-        # Test the urgency calculator directly with invalid date
-        # (bypassing Pydantic validation which would reject it)
-        score = self.scorer.calculate_urgency_score("invalid-date")
-        assert score == 50, "Invalid dates should return neutral score"
-    
-    def test_suggest_top_tasks(self):
-        """Test suggesting top tasks."""
-        suggestions = self.scorer.suggest_top_tasks(self.sample_tasks, count=2)
-        
-        assert len(suggestions) <= 2, "Should return at most requested count"
-        assert all(task.priority_score and task.priority_score > 0 for task in suggestions), \
-            "All suggestions should have valid scores"
-    
-    def test_different_strategies(self):
-        """Test that different strategies produce different results."""
-        strategies = ["smart_balance", "fastest_wins", "high_impact", "deadline_driven"]
-        results = {}
-        
-        for strategy in strategies:
-            scorer = TaskScorer(strategy=strategy)
-            scored = scorer.score_tasks(self.sample_tasks)
-            results[strategy] = [task.priority_score for task in scored]
-        
-        # At least some strategies should produce different orderings
-        unique_results = len(set(tuple(r) for r in results.values()))
-        assert unique_results > 1, "Different strategies should produce different results"
-
-
-    def test_business_days_calculation(self):
-        """Test business days calculation excluding weekends."""
-        # Monday to Friday (same week) = 4 business days
-        monday = datetime(2025, 12, 1)  # Monday
-        friday = datetime(2025, 12, 5)  # Friday
-        
-        business_days = self.scorer.calculate_business_days(monday, friday)
-        assert business_days == 4, "Monday to Friday should be 4 business days"
-        
-        # Friday to Monday (next week) = 1 business day (only Monday)
-        friday = datetime(2025, 12, 5)  # Friday
-        monday_next = datetime(2025, 12, 8)  # Monday
-        
-        business_days = self.scorer.calculate_business_days(friday, monday_next)
-        assert business_days == 1, "Friday to next Monday should be 1 business day"
-    
-    def test_weekend_urgency_boost(self):
-        """Test that tasks due on weekends get urgency boost."""
-        # Create a specific Saturday date (Dec 6, 2025 is a Saturday)
-        saturday = "2025-12-06"
-        
-        scorer_with_business_days = TaskScorer(strategy="smart_balance", use_business_days=True)
-        
-        # Calculate score - should include weekend boost
-        score = scorer_with_business_days.calculate_urgency_score(saturday)
-        
-        # Verify it's a valid score and weekend is detected
-        assert isinstance(score, float), "Should return a valid score"
-        assert score > 0, "Should return a positive score"
-        
-        # Verify weekend detection
-        saturday_date = datetime(2025, 12, 6)
-        assert scorer_with_business_days.is_weekend(saturday_date), "Dec 6, 2025 should be a weekend"
-    
-    def test_holiday_exclusion(self):
-        """Test that holidays are excluded from business days."""
-        # Test with Christmas 2025 (Dec 25)
-        christmas = datetime(2025, 12, 25)
-        assert self.scorer.is_holiday(christmas), "Christmas should be recognized as holiday"
-        
-        # Test with regular day
-        regular_day = datetime(2025, 12, 15)
-        assert not self.scorer.is_holiday(regular_day), "Regular day should not be holiday"
-        
-        # Test business days calculation around holiday
-        # Dec 23 (Tue) to Dec 26 (Fri) should be 2 business days (23, 24, skip 25 holiday, 26)
-        # Actually: 23, 24 = 2 days (25 is holiday, 26 is not included in range)
-        before_christmas = datetime(2025, 12, 23)
-        after_christmas = datetime(2025, 12, 26)
-        
-        business_days = self.scorer.calculate_business_days(before_christmas, after_christmas)
-        # Should be 2: Dec 23 and Dec 24 (Dec 25 is holiday, Dec 26 is end date not included)
-        assert business_days == 2, "Should exclude Christmas from business days"
+from scoring import TaskScorer, _adjacency
+from _kernel import urgency_band
+
+
+STRATEGIES = ["smart_balance", "fastest_wins", "high_impact", "deadline_driven"]
+
+# Reference due dates, materialized once at import from a single clock reading.
+# Validated tasks carry date objects, so the fixtures use them too.
+TODAY = date.today()
+NEXT_WEEK = TODAY + timedelta(days=7)
+OVERDUE = TODAY - timedelta(days=2)
+FUTURE = TODAY + timedelta(days=30)
+
+
+@lru_cache(maxsize=None)
+def _scorer(strategy: str, use_business_days: bool = True) -> TaskScorer:
+    """Shared scorer per configuration (TaskScorer is stateless between calls)."""
+    return TaskScorer(strategy=strategy, use_business_days=use_business_days)
+
+
+@pytest.fixture(scope="module")
+def sample_tasks():
+    """Sample tasks for testing (scoring never mutates its input)."""
+    return [
+        TaskBase(
+            title="Fix critical bug",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=9,
+            dependencies=[]
+        ),
+        TaskBase(
+            title="Write documentation",
+            due_date=NEXT_WEEK,
+            estimated_hours=5.0,
+            importance=5,
+            dependencies=[]
+        ),
+        TaskBase(
+            title="Overdue task",
+            due_date=OVERDUE,
+            estimated_hours=3.0,
+            importance=7,
+            dependencies=[]
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def circular_tasks():
+    """Tasks with circular dependency: 0 -> 1 -> 2 -> 0"""
+    return [
+        TaskBase(
+            title="Task A",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[2]  # Depends on task 2
+        ),
+        TaskBase(
+            title="Task B",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[0]  # Depends on task 0
+        ),
+        TaskBase(
+            title="Task C",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[1]  # Depends on task 1
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def circular_adjacency(circular_tasks):
+    """Dependency adjacency of circular_tasks, built once for cycle detection."""
+    return _adjacency(circular_tasks)
+
+
+@pytest.fixture(scope="module")
+def blocking_tasks():
+    """One task that two other tasks depend on."""
+    return [
+        TaskBase(
+            title="Blocking task",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[]
+        ),
+        TaskBase(
+            title="Dependent task 1",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[0]
+        ),
+        TaskBase(
+            title="Dependent task 2",
+            due_date=TODAY,
+            estimated_hours=2.0,
+            importance=5,
+            dependencies=[0]
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
+def many_tasks():
+    """1000 deterministic synthetic tasks spread over due dates, effort and importance."""
+    return [
+        TaskBase(
+            title=f"Task {i}",
+            due_date=TODAY + timedelta(days=i % 45 - 5),
+            estimated_hours=float(i % 12 + 1),
+            importance=i % 10 + 1,
+            dependencies=[i - 1] if i % 7 == 0 and i > 0 else []
+        )
+        for i in range(1000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def scored_sample(sample_tasks):
+    """sample_tasks scored once with smart_balance, shared by the tests that read it."""
+    return _scorer("smart_balance").score_tasks(sample_tasks)
+
+
+@pytest.fixture(scope="module")
+def strategy_results(sample_tasks):
+    """Scores of sample_tasks under each strategy, computed once per strategy."""
+    return {
+        strategy: [task.priority_score for task in _scorer(strategy).score_tasks(sample_tasks)]
+        for strategy in STRATEGIES
+    }
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    """Default smart_balance scorer, shared by every test in the module."""
+    return _scorer("smart_balance")
+
+
+@pytest.mark.parametrize("due, compare, threshold, message", [
+    (OVERDUE, operator.gt, 100, "Overdue tasks should have score > 100"),
+    (TODAY, operator.ge, 90, "Tasks due today should have high urgency"),
+    (FUTURE, operator.lt, 50, "Far future tasks should have lower urgency"),
+], ids=["overdue", "today", "future"])
+def test_urgency_score(scorer, due, compare, threshold, message):
+    """Test urgency score for overdue, due-today and far-future tasks."""
+    score = scorer.calculate_urgency_score(due)
+    assert compare(score, threshold), message
+
+
+@pytest.mark.parametrize("weekend_boost", [0.0, 10.0])
+def test_urgency_bands_match_scalar_band(weekend_boost):
+    """Test that the vectorized urgency bands agree with the scalar band function."""
+    days = np.arange(-40, 120)
+    bands = scoring._urgency_bands(days, np.full(len(days), weekend_boost))
+    assert [urgency_band(int(d), weekend_boost) for d in days] == bands.tolist()
+
+
+def test_effort_score_fastest_wins():
+    """Test effort scoring with fastest_wins strategy."""
+    scorer = _scorer("fastest_wins")
+    quick_task_score = scorer.calculate_effort_score(1.0, "fastest_wins")
+    long_task_score = scorer.calculate_effort_score(10.0, "fastest_wins")
+    assert quick_task_score > long_task_score, "Quick tasks should score higher in fastest_wins"
+
+
+@pytest.mark.slow
+def test_circular_dependency_detection(scorer, circular_tasks, circular_adjacency):
+    """Test detection of circular dependencies."""
+    assert circular_adjacency == (frozenset({2}), frozenset({0}), frozenset({1}))
+    
+    circular_deps = scorer.detect_circular_dependencies(circular_adjacency)
+    assert len(circular_deps) > 0, "Should detect circular dependencies"
+    assert {0, 1, 2} <= circular_deps, "Every task in the 0 -> 1 -> 2 -> 0 cycle should be flagged"
+    assert scorer.detect_circular_dependencies(circular_tasks) == circular_deps, \
+        "Tasks and their adjacency should give the same result"
+
+
+def test_task_leading_into_cycle_not_flagged(scorer, circular_tasks):
+    """Test that a task depending on a cycle, but not part of it, is not flagged."""
+    tasks = circular_tasks + [
+        TaskBase(title="Task D", due_date=TODAY, estimated_hours=2.0, importance=5, dependencies=[0])
+    ]
+    circular_deps = scorer.detect_circular_dependencies(tasks)
+    assert circular_deps == {0, 1, 2}, "Only the members of the cycle should be flagged"
+
+
+def test_self_dependency_detected(scorer):
+    """Test that a task depending on itself counts as circular."""
+    tasks = [
+        TaskBase(title="Loop", due_date=TODAY, estimated_hours=2.0, importance=5, dependencies=[0]),
+        TaskBase(title="Plain", due_date=TODAY, estimated_hours=2.0, importance=5, dependencies=[]),
+    ]
+    assert scorer.detect_circular_dependencies(tasks) == {0}
+
+
+@pytest.mark.slow
+def test_long_dependency_chain(scorer):
+    """Test that long chains are walked without hitting the recursion limit."""
+    n = 10_000
+    chain = tuple(frozenset({i + 1}) if i + 1 < n else frozenset() for i in range(n))
+    assert scorer.detect_circular_dependencies(chain) == frozenset(), "A plain chain has no cycle"
+    
+    # Closing the chain makes every task part of one cycle
+    ring = chain[:-1] + (frozenset({0}),)
+    assert scorer.detect_circular_dependencies(ring) == frozenset(range(n))
+
+
+def test_dependency_score(scorer, blocking_tasks):
+    """Test dependency scoring - tasks that block others score higher."""
+    score = scorer.calculate_dependency_score(0, blocking_tasks)
+    assert score > 0, "Task blocking others should have positive dependency score"
+
+
+def test_score_tasks_sorting(scored_sample, sample_tasks):
+    """Test that tasks are properly sorted by priority."""
+    scored = scored_sample
+    
+    # Check that we got all tasks back
+    assert len(scored) == len(sample_tasks)
+    
+    # Check that scores are in descending order (single vectorized pass, no re-sort)
+    scores = np.fromiter(
+        (task.priority_score for task in scored if task.priority_score is not None),
+        dtype=np.float64
+    )
+    assert (np.diff(scores) <= 0).all(), "Tasks should be sorted by score descending"
+
+
+@pytest.mark.benchmark(group="score_tasks")
+def test_score_tasks_perf(benchmark, scorer, sample_tasks):
+    """Benchmark the score_tasks hot path (compare runs with --benchmark-compare-fail)."""
+    result = benchmark(scorer.score_tasks, sample_tasks)
+    assert len(result) == len(sample_tasks)
+
+
+def test_invalid_date_handling(scorer):
+    """Test handling of invalid date formats."""
+    # Test the urgency calculator directly with invalid date
+    # (bypassing Pydantic validation which would reject it)
+    score = scorer.calculate_urgency_score("invalid-date")
+    assert score == 50, "Invalid dates should return neutral score"
+    
+    # The real constructor still rejects it at the API boundary
+    with pytest.raises(ValidationError):
+        TaskBase(title="Bad date", due_date="invalid-date", estimated_hours=1.0, importance=5)
+    with pytest.raises(ValidationError):
+        TaskBase(title="Timestamp", due_date=1733443200, estimated_hours=1.0, importance=5)
+
+
+def test_suggest_top_tasks(scorer, sample_tasks, scored_sample):
+    """Test suggesting top tasks."""
+    suggestions = scorer.suggest_top_tasks(sample_tasks, count=2)
+    
+    assert len(suggestions) <= 2, "Should return at most requested count"
+    assert all((score := task.priority_score) is not None and score > 0 for task in suggestions), \
+        "All suggestions should have valid scores"
+    
+    # Suggestions are the head of the full ranking
+    assert [t.id for t in suggestions] == [t.id for t in scored_sample[:len(suggestions)]]
+
+
+@pytest.mark.parametrize("count", [2, 10, 100])
+def test_suggest_top_tasks_matches_full_ranking(scorer, many_tasks, count):
+    """Test that the partial sort in suggest_top_tasks picks the same head as a full sort."""
+    suggestions = scorer.suggest_top_tasks(many_tasks, count=count)
+    
+    ranked = sorted(
+        (t.priority_score for t in scorer.score_tasks(many_tasks, include_explanations=False)
+         if t.priority_score and t.priority_score > 0),
+        reverse=True
+    )
+    assert len(suggestions) == count
+    assert [t.priority_score for t in suggestions] == ranked[:count]
+    assert all(t.explanation for t in suggestions), "Suggestions should carry explanations"
+
+
+@pytest.mark.benchmark(group="suggest_top_tasks")
+@pytest.mark.parametrize("count", [2, 10, 100])
+def test_suggest_top_tasks_perf(benchmark, scorer, many_tasks, count):
+    """Benchmark suggest_top_tasks on 1000 tasks for several suggestion counts."""
+    suggestions = benchmark(scorer.suggest_top_tasks, many_tasks, count)
+    assert len(suggestions) == count
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_strategy_scores_every_task(strategy, sample_tasks):
+    """Test that each strategy scores every task."""
+    # Scores only its own strategy, so pytest-xdist can spread the cases over workers
+    scores = [task.priority_score for task in _scorer(strategy).score_tasks(sample_tasks)]
+    assert len(scores) == len(sample_tasks)
+    assert all(score is not None for score in scores), f"{strategy} should score every task"
+
+
+@pytest.mark.slow
+def test_different_strategies(strategy_results):
+    """Test that different strategies produce different results."""
+    results = strategy_results
+    
+    # At least some strategies should produce different orderings
+    # (any() stops at the first differing pair)
+    assert any(not np.array_equal(results[a], results[b]) for a, b in combinations(STRATEGIES, 2)), \
+        "Different strategies should produce different results"
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_batch_paths_match_scalar_scores(monkeypatch, strategy, many_tasks):
+    """Test that the compiled kernel, the NumPy path and the scalar path give identical scores."""
+    scorer = _scorer(strategy)
+    tasks = many_tasks[:200]
+    
+    # Compiled kernel when Numba is installed, NumPy path otherwise
+    default_scores = [t.priority_score for t in scorer.score_tasks(tasks, include_explanations=False)]
+    
+    monkeypatch.setattr(scoring, "score_kernel", None)
+    numpy_ranked = scorer.score_tasks(tasks, include_explanations=False)
+    assert [t.priority_score for t in numpy_ranked] == default_scores, \
+        "Kernel and NumPy paths should agree exactly"
+    
+    circular_deps = scorer.detect_circular_dependencies(tasks)
+    numpy_scores = {t.id: t.priority_score for t in numpy_ranked}
+    for idx, task in enumerate(tasks):
+        score, _ = scorer.calculate_priority_score(task, idx, tasks, circular_deps)
+        assert score == numpy_scores[idx], f"Task {idx} should score the same on the scalar path"
+
+
+def test_business_days_calculation(scorer):
+    """Test business days calculation excluding weekends."""
+    # Monday to Friday (same week) = 4 business days
+    monday = datetime(2025, 12, 1)  # Monday
+    friday = datetime(2025, 12, 5)  # Friday
+    
+    business_days = scorer.calculate_business_days(monday, friday)
+    assert business_days == 4, "Monday to Friday should be 4 business days"
+    
+    # Friday to Monday (next week) = 1 business day (only Monday)
+    friday = datetime(2025, 12, 5)  # Friday
+    monday_next = datetime(2025, 12, 8)  # Monday
+    
+    business_days = scorer.calculate_business_days(friday, monday_next)
+    assert business_days == 1, "Friday to next Monday should be 1 business day"
+
+
+def test_weekend_urgency_boost():
+    """Test that tasks due on weekends get urgency boost."""
+    # Create a specific Saturday date (Dec 6, 2025 is a Saturday)
+    saturday = date(2025, 12, 6)
+    
+    scorer_with_business_days = _scorer("smart_balance", use_business_days=True)
+    
+    # Calculate score - should include weekend boost
+    score = scorer_with_business_days.calculate_urgency_score(saturday)
+    
+    # Verify it's a valid score and weekend is detected
+    assert isinstance(score, float), "Should return a valid score"
+    assert score > 0, "Should return a positive score"
+    
+    # Verify weekend detection
+    saturday_date = datetime(2025, 12, 6)
+    assert scorer_with_business_days.is_weekend(saturday_date), "Dec 6, 2025 should be a weekend"
+
+
+def test_holiday_exclusion(scorer):
+    """Test that holidays are excluded from business days."""
+    # Test with Christmas 2025 (Dec 25)
+    christmas = datetime(2025, 12, 25)
+    assert scorer.is_holiday(christmas), "Christmas should be recognized as holiday"
+    
+    # Test with regular day
+    regular_day = datetime(2025, 12, 15)
+    assert not scorer.is_holiday(regular_day), "Regular day should not be holiday"
+    
+    # Test business days calculation around holiday
+    # Dec 23 (Tue) to Dec 26 (Fri) should be 2 business days (23, 24, skip 25 holiday, 26)
+    # Actually: 23, 24 = 2 days (25 is holiday, 26 is not included in range)
+    before_christmas = datetime(2025, 12, 23)
+    after_christmas = datetime(2025, 12, 26)
+    
+    business_days = scorer.calculate_business_days(before_christmas, after_christmas)
+    # Should be 2: Dec 23 and Dec 24 (Dec 25 is holiday, Dec 26 is end date not included)
+    assert business_days == 2, "Should exclude Christmas from business days"
 
 
 if __name__ == "__main__":